@@ -34,22 +34,29 @@ This is a lossy translation from the IDL Syntax tree as the IDL AST only contain
 the enums and structs that need code generated for them, and just enough information to do that.
 """
 
-from typing import List, Union, Any, Optional, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from . import common
-from . import errors
+
+# Only needed for annotations, which are never evaluated at runtime.
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Sequence, Tuple
+
+    from . import errors
 
 
 class IDLBoundSpec(object):
     """A bound IDL document or a set of errors if parsing failed."""
 
     def __init__(self, spec, error_collection):
-        # type: (IDLAST, errors.ParserErrorCollection) -> None
+        # type: (Optional[IDLAST], Optional[errors.ParserErrorCollection]) -> None
         """Must specify either an IDL document or errors, not both."""
-        assert (spec is None and error_collection is not None) or (spec is not None
-                                                                   and error_collection is None)
-        self.spec = spec
-        self.errors = error_collection
+        if (spec is None) == (error_collection is None):
+            raise ValueError("exactly one of spec/error_collection required")
+        self.spec: Optional[IDLAST] = spec
+        self.errors: Optional[errors.ParserErrorCollection] = error_collection
 
 
 class IDLAST(object):
@@ -58,14 +65,18 @@ class IDLAST(object):
     def __init__(self):
         # type: () -> None
         """Construct an IDLAST."""
-        self.globals = None  # type: Global
+        self.globals: Optional[Global] = None
 
-        self.commands = []  # type: List[Command]
-        self.enums = []  # type: List[Enum]
-        self.structs = []  # type: List[Struct]
+        self.commands: List[Command] = []
+        self.enums: List[Enum] = []
+        self.structs: List[Struct] = []
 
-        self.server_parameters = []  # type: List[ServerParameter]
-        self.configs = []  # type: List[ConfigOption]
+        self.server_parameters: List[ServerParameter] = []
+        self.configs: List[ConfigOption] = []
+
+        # Per-attribute columns parallel to the lists above, for generator passes which only need
+        # a single attribute of every node.
+        self.server_parameter_feature_flags: List[bool] = []
 
 
 class Global(common.SourceLocation):
@@ -75,12 +86,18 @@ class Global(common.SourceLocation):
     cpp_namespace and cpp_includes are only populated if the IDL document contains these YAML nodes.
     """
 
+    __slots__ = ("cpp_namespace", "cpp_includes", "configs")
+
+    cpp_namespace: Optional[str]
+    cpp_includes: Tuple[str, ...]
+    configs: Optional[ConfigGlobal]
+
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a Global."""
-        self.cpp_namespace = None  # type: str
-        self.cpp_includes = []  # type: List[str]
-        self.configs = None  # type: ConfigGlobal
+        self.cpp_namespace = None
+        self.cpp_includes = ()
+        self.configs = None
 
         super(Global, self).__init__(file_name, line, column)
 
@@ -93,30 +110,60 @@ class Struct(common.SourceLocation):
     """
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = ("name", "cpp_name", "description", "strict", "immutable", "inline_chained_structs",
+                 "generate_comparison_operators", "fields", "_field_by_name")
+
+    name: Optional[str]
+    cpp_name: Optional[str]
+    description: Optional[str]
+    strict: bool
+    immutable: bool
+    inline_chained_structs: bool
+    generate_comparison_operators: bool
+    fields: List[Field]
+    _field_by_name: Dict[Optional[str], Field]
 
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a struct."""
-        self.name = None  # type: str
-        self.cpp_name = None  # type: str
-        self.description = None  # type: str
-        self.strict = True  # type: bool
-        self.immutable = False  # type: bool
-        self.inline_chained_structs = False  # type: bool
-        self.generate_comparison_operators = False  # type: bool
-        self.fields = []  # type: List[Field]
+        self.name = None
+        self.cpp_name = None
+        self.description = None
+        self.strict = True
+        self.immutable = False
+        self.inline_chained_structs = False
+        self.generate_comparison_operators = False
+        self.fields = []
+        self._field_by_name = {}
         super(Struct, self).__init__(file_name, line, column)
 
+    def add_field(self, field):
+        # type: (Field) -> None
+        """Add a field, and index it by name."""
+        self.fields.append(field)
+        self._field_by_name[field.name] = field
+
+    def find_field(self, name):
+        # type: (str) -> Optional[Field]
+        """Find a field by name, or return None."""
+        return self._field_by_name.get(name)
+
 
 class Expression(common.SourceLocation):
     """Literal of C++ expression representation."""
 
+    __slots__ = ("expr", "validate_constexpr", "export")
+
+    expr: Optional[str]
+    validate_constexpr: bool
+    export: bool
+
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct an Expression."""
-        self.expr = None  # type: str
-        self.validate_constexpr = True  # type: bool
-        self.export = False  # type: bool
+        self.expr = None
+        self.validate_constexpr = True
+        self.export = False
 
         super(Expression, self).__init__(file_name, line, column)
 
@@ -130,17 +177,24 @@ class Validator(common.SourceLocation):
     """
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = ("gt", "lt", "gte", "lte", "callback")
+
+    # Don't lint gt/lt as bad attribute names.
+    # pylint: disable=C0103
+    gt: Optional[Expression]
+    lt: Optional[Expression]
+    gte: Optional[Expression]
+    lte: Optional[Expression]
+    callback: Optional[str]
 
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a Validator."""
-        # Don't lint gt/lt as bad attribute names.
-        # pylint: disable=C0103
-        self.gt = None  # type: Expression
-        self.lt = None  # type: Expression
-        self.gte = None  # type: Expression
-        self.lte = None  # type: Expression
-        self.callback = None  # type: Optional[str]
+        self.gt = None
+        self.lt = None
+        self.gte = None
+        self.lte = None
+        self.callback = None
 
         super(Validator, self).__init__(file_name, line, column)
 
@@ -155,46 +209,74 @@ class Field(common.SourceLocation):
     """
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = ("name", "description", "cpp_name", "optional", "ignore", "chained",
+                 "comparison_order", "non_const_getter", "cpp_type", "bson_serialization_type",
+                 "serializer", "deserializer", "bindata_subtype", "default", "struct_type", "array",
+                 "supports_doc_sequence", "enum_type", "chained_struct_field",
+                 "serialize_op_msg_request_only", "constructed", "validator")
+
+    name: Optional[str]
+    description: Optional[str]
+    cpp_name: Optional[str]
+    optional: bool
+    ignore: bool
+    chained: bool
+    comparison_order: int
+    non_const_getter: bool
+
+    # Properties specific to fields which are types.
+    cpp_type: Optional[str]
+    bson_serialization_type: Optional[Sequence[str]]
+    serializer: Optional[str]
+    deserializer: Optional[str]
+    bindata_subtype: Optional[str]
+    default: Optional[str]
+
+    # Properties specific to fields which are structs.
+    struct_type: Optional[str]
+
+    # Properties specific to fields which are arrays.
+    array: bool
+    supports_doc_sequence: bool
+
+    # Properties specific to fields which are enums.
+    enum_type: bool
+
+    # Properties specific to fields inlined from chained_structs
+    chained_struct_field: Optional[Field]
+
+    # Internal fields - not generated by parser
+    serialize_op_msg_request_only: bool
+    constructed: bool
+
+    # Validation rules.
+    validator: Optional[Validator]
 
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a Field."""
-        self.name = None  # type: str
-        self.description = None  # type: str
-        self.cpp_name = None  # type: str
-        self.optional = False  # type: bool
-        self.ignore = False  # type: bool
-        self.chained = False  # type: bool
-        self.comparison_order = -1  # type: int
-        self.non_const_getter = False  # type: bool
-
-        # Properties specific to fields which are types.
-        self.cpp_type = None  # type: str
-        self.bson_serialization_type = None  # type: List[str]
-        self.serializer = None  # type: str
-        self.deserializer = None  # type: str
-        self.bindata_subtype = None  # type: str
-        self.default = None  # type: str
-
-        # Properties specific to fields which are structs.
-        self.struct_type = None  # type: str
-
-        # Properties specific to fields which are arrays.
-        self.array = False  # type: bool
-        self.supports_doc_sequence = False  # type: bool
-
-        # Properties specific to fields which are enums.
-        self.enum_type = False  # type: bool
-
-        # Properties specific to fields inlined from chained_structs
-        self.chained_struct_field = None  # type: Field
-
-        # Internal fields - not generated by parser
-        self.serialize_op_msg_request_only = False  # type: bool
-        self.constructed = False  # type: bool
-
-        # Validation rules.
-        self.validator = None  # type: Optional[Validator]
+        self.name = None
+        self.description = None
+        self.cpp_name = None
+        self.optional = False
+        self.ignore = False
+        self.chained = False
+        self.comparison_order = -1
+        self.non_const_getter = False
+        self.cpp_type = None
+        self.bson_serialization_type = None
+        self.serializer = None
+        self.deserializer = None
+        self.bindata_subtype = None
+        self.default = None
+        self.struct_type = None
+        self.array = False
+        self.supports_doc_sequence = False
+        self.enum_type = False
+        self.chained_struct_field = None
+        self.serialize_op_msg_request_only = False
+        self.constructed = False
+        self.validator = None
 
         super(Field, self).__init__(file_name, line, column)
 
@@ -207,35 +289,50 @@ class Command(Struct):
     """
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = ("namespace", "command_field", "reply_type", "api_version", "is_deprecated",
+                 "unstable", "forward_to_shards", "forward_from_shards")
+
+    namespace: Optional[str]
+    command_field: Optional[Field]
+    reply_type: Optional[Field]
+    api_version: str
+    is_deprecated: bool
+    unstable: bool
+    forward_to_shards: bool
+    forward_from_shards: bool
 
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a command."""
-        self.namespace = None  # type: str
-        self.command_field = None  # type: Field
-        self.reply_type = None  # type: Field
-        self.api_version = ""  # type: str
-        self.is_deprecated = False  # type: bool
-        self.unstable = False  # type: bool
-        self.forward_to_shards = False  # type: bool
-        self.forward_from_shards = False  # type: bool
+        self.namespace = None
+        self.command_field = None
+        self.reply_type = None
+        self.api_version = ""
+        self.is_deprecated = False
+        self.unstable = False
+        self.forward_to_shards = False
+        self.forward_from_shards = False
         super(Command, self).__init__(file_name, line, column)
 
 
-class EnumValue(common.SourceLocation):
+class EnumValue(object):
     """
     IDL Enum Value information.
 
     All fields are either required or have a non-None default.
+    Errors are reported against the enum, so enum values carry no source location.
     """
 
-    def __init__(self, file_name, line, column):
-        # type: (str, int, int) -> None
-        """Construct an Enum."""
-        self.name = None  # type: str
-        self.value = None  # type: str
+    __slots__ = ("name", "value")
 
-        super(EnumValue, self).__init__(file_name, line, column)
+    name: Optional[str]
+    value: Optional[str]
+
+    def __init__(self):
+        # type: () -> None
+        """Construct an EnumValue."""
+        self.name = None
+        self.value = None
 
 
 class Enum(common.SourceLocation):
@@ -245,42 +342,65 @@ class Enum(common.SourceLocation):
     All fields are either required or have a non-None default.
     """
 
+    __slots__ = ("name", "description", "cpp_namespace", "type", "values")
+
+    name: Optional[str]
+    description: Optional[str]
+    cpp_namespace: Optional[str]
+    type: Optional[str]
+    values: List[EnumValue]
+
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct an Enum."""
-        self.name = None  # type: str
-        self.description = None  # type: str
-        self.cpp_namespace = None  # type: str
-        self.type = None  # type: str
-        self.values = []  # type: List[EnumValue]
+        self.name = None
+        self.description = None
+        self.cpp_namespace = None
+        self.type = None
+        self.values = []
 
         super(Enum, self).__init__(file_name, line, column)
 
 
-class Condition(common.SourceLocation):
-    """Condition(s) for a ServerParameter or ConfigOption."""
+class Condition(object):
+    """
+    Condition(s) for a ServerParameter or ConfigOption.
 
-    def __init__(self, file_name, line, column):
-        # type: (str, int, int) -> None
-        """Construct a Condition."""
-        self.expr = None  # type: str
-        self.constexpr = None  # type: str
-        self.preprocessor = None  # type: str
+    Errors are reported against the owning setting, so conditions carry no source location.
+    """
+
+    __slots__ = ("expr", "constexpr", "preprocessor")
 
-        super(Condition, self).__init__(file_name, line, column)
+    expr: Optional[str]
+    constexpr: Optional[str]
+    preprocessor: Optional[str]
+
+    def __init__(self):
+        # type: () -> None
+        """Construct a Condition."""
+        self.expr = None
+        self.constexpr = None
+        self.preprocessor = None
 
 
 class ServerParameterClass(common.SourceLocation):
     """ServerParameter as C++ class specialization."""
 
+    __slots__ = ("name", "data", "override_ctor", "override_set")
+
+    name: Optional[str]
+    data: Optional[str]
+    override_ctor: bool
+    override_set: bool
+
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a ServerParameterClass."""
 
-        self.name = None  # type: str
-        self.data = None  # type: str
-        self.override_ctor = False  # type: bool
-        self.override_set = False  # type: bool
+        self.name = None
+        self.data = None
+        self.override_ctor = False
+        self.override_set = False
 
         super(ServerParameterClass, self).__init__(file_name, line, column)
 
@@ -289,26 +409,44 @@ class ServerParameter(common.SourceLocation):
     """IDL ServerParameter setting."""
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = ("name", "set_at", "description", "cpp_class", "cpp_vartype", "cpp_varname",
+                 "condition", "redact", "test_only", "deprecated_name", "default", "feature_flag",
+                 "validator", "on_update")
+
+    name: Optional[str]
+    set_at: Optional[str]
+    description: Optional[str]
+    cpp_class: Optional[ServerParameterClass]
+    cpp_vartype: Optional[str]
+    cpp_varname: Optional[str]
+    condition: Optional[Condition]
+    redact: bool
+    test_only: bool
+    deprecated_name: Tuple[str, ...]
+    default: Optional[Expression]
+    feature_flag: bool
+
+    # Only valid if cpp_varname is specified.
+    validator: Optional[Validator]
+    on_update: Optional[str]
 
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a ServerParameter."""
-        self.name = None  # type: str
-        self.set_at = None  # type: str
-        self.description = None  # type: str
-        self.cpp_class = None  # type: ServerParameterClass
-        self.cpp_vartype = None  # type: str
-        self.cpp_varname = None  # type: str
-        self.condition = None  # type: Condition
-        self.redact = False  # type: bool
-        self.test_only = False  # type: bool
-        self.deprecated_name = []  # type: List[str]
-        self.default = None  # type: Expression
-        self.feature_flag = False  # type : bool
-
-        # Only valid if cpp_varname is specified.
-        self.validator = None  # type: Validator
-        self.on_update = None  # type: str
+        self.name = None
+        self.set_at = None
+        self.description = None
+        self.cpp_class = None
+        self.cpp_vartype = None
+        self.cpp_varname = None
+        self.condition = None
+        self.redact = False
+        self.test_only = False
+        self.deprecated_name = ()
+        self.default = None
+        self.feature_flag = False
+        self.validator = None
+        self.on_update = None
 
         super(ServerParameter, self).__init__(file_name, line, column)
 
@@ -316,62 +454,104 @@ class ServerParameter(common.SourceLocation):
 class GlobalInitializer(common.SourceLocation):
     """Initializer details for custom registration/storage."""
 
+    __slots__ = ("name", "register", "store")
+
+    name: Optional[str]
+    register: Optional[str]
+    store: Optional[str]
+
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a GlobalInitializer."""
 
-        self.name = None  # type: str
-        self.register = None  # type: str
-        self.store = None  # type: str
+        self.name = None
+        self.register = None
+        self.store = None
 
         super(GlobalInitializer, self).__init__(file_name, line, column)
 
 
-class ConfigGlobal(common.SourceLocation):
-    """IDL ConfigOption Globals."""
+class ConfigGlobal(object):
+    """
+    IDL ConfigOption Globals.
 
-    def __init__(self, file_name, line, column):
-        # type: (str, int, int) -> None
-        """Construct a ConfigGlobal."""
+    Config globals are never the subject of a binder error, so they carry no source location.
+    """
 
-        # Other config globals are consumed in bind phase.
-        self.initializer = None  # type: GlobalInitializer
+    __slots__ = ("initializer", )
+
+    # Other config globals are consumed in bind phase.
+    initializer: Optional[GlobalInitializer]
+
+    def __init__(self):
+        # type: () -> None
+        """Construct a ConfigGlobal."""
 
-        super(ConfigGlobal, self).__init__(file_name, line, column)
+        self.initializer = None
 
 
 class ConfigOption(common.SourceLocation):
     """IDL ConfigOption setting."""
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = ("name", "short_name", "deprecated_name", "deprecated_short_name", "description",
+                 "section", "arg_vartype", "cpp_vartype", "cpp_varname", "condition", "conflicts",
+                 "requires", "hidden", "redact", "default", "implicit", "source", "canonicalize",
+                 "duplicates_append", "positional_start", "positional_end", "validator")
+
+    name: Optional[str]
+    short_name: Optional[str]
+    deprecated_name: Tuple[str, ...]
+    deprecated_short_name: Tuple[str, ...]
+
+    description: Optional[Expression]
+    section: Optional[str]
+    arg_vartype: Optional[str]
+    cpp_vartype: Optional[str]
+    cpp_varname: Optional[str]
+    condition: Optional[Condition]
+
+    conflicts: List[str]
+    requires: List[str]
+    hidden: bool
+    redact: bool
+    default: Optional[Expression]
+    implicit: Optional[Expression]
+    source: Optional[str]
+    canonicalize: Optional[str]
+
+    duplicates_append: bool
+    positional_start: Optional[int]
+    positional_end: Optional[int]
+    validator: Optional[Validator]
 
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a ConfigOption."""
-        self.name = None  # type: str
-        self.short_name = None  # type: str
-        self.deprecated_name = []  # type: List[str]
-        self.deprecated_short_name = []  # type: List[str]
-
-        self.description = None  # type: Expression
-        self.section = None  # type: str
-        self.arg_vartype = None  # type: str
-        self.cpp_vartype = None  # type: str
-        self.cpp_varname = None  # type: str
-        self.condition = None  # type: Condition
-
-        self.conflicts = []  # type: List[str]
-        self.requires = []  # type: List[str]
-        self.hidden = False  # type: bool
-        self.redact = False  # type: bool
-        self.default = None  # type: Expression
-        self.implicit = None  # type: Expression
-        self.source = None  # type: str
-        self.canonicalize = None  # type: str
-
-        self.duplicates_append = False  # type: bool
-        self.positional_start = None  # type: int
-        self.positional_end = None  # type: int
-        self.validator = None  # type: Validator
+        self.name = None
+        self.short_name = None
+        self.deprecated_name = ()
+        self.deprecated_short_name = ()
+
+        self.description = None
+        self.section = None
+        self.arg_vartype = None
+        self.cpp_vartype = None
+        self.cpp_varname = None
+        self.condition = None
+
+        self.conflicts = []
+        self.requires = []
+        self.hidden = False
+        self.redact = False
+        self.default = None
+        self.implicit = None
+        self.source = None
+        self.canonicalize = None
+
+        self.duplicates_append = False
+        self.positional_start = None
+        self.positional_end = None
+        self.validator = None
 
         super(ConfigOption, self).__init__(file_name, line, column)
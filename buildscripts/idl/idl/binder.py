@@ -29,7 +29,8 @@
 """Transform idl.syntax trees from the parser into well-defined idl.ast trees."""
 
 import re
-from typing import cast, List, Set, Union
+import sys
+from typing import cast, List, Optional, Set, Tuple, Union
 
 from . import ast
 from . import bson
@@ -40,6 +41,21 @@ from . import errors
 from . import syntax
 
 
+def _intern(value):
+    # type: (Optional[str]) -> Optional[str]
+    """Intern a C++ name or type which is repeated across many AST nodes."""
+    if value is None:
+        return None
+
+    return sys.intern(value)
+
+
+def _intern_tuple(values):
+    # type: (List[str]) -> Tuple[str, ...]
+    """Intern each string in a list of names, and freeze the list into a tuple."""
+    return tuple(sys.intern(value) for value in values)
+
+
 def _validate_single_bson_type(ctxt, idl_type, syntax_type):
     # type: (errors.ParserContext, Union[syntax.Type, ast.Field], str) -> bool
     """Validate bson serialization type is correct for a type."""
@@ -230,16 +246,13 @@ def _validate_types(ctxt, parsed_spec):
         _validate_type(ctxt, idl_type)
 
 
-def _is_duplicate_field(ctxt, field_container, fields, ast_field):
-    # type: (errors.ParserContext, str, List[ast.Field], ast.Field) -> bool
+def _is_duplicate_field(ctxt, field_container, ast_struct, ast_field):
+    # type: (errors.ParserContext, str, ast.Struct, ast.Field) -> bool
     """Return True if there is a naming conflict for a given field."""
 
     # This is normally tested in the parser as part of duplicate detection in a map
-    if ast_field.name in [field.name for field in fields]:
-        for field in fields:
-            if field.name == ast_field.name:
-                duplicate_field = field
-
+    duplicate_field = ast_struct.find_field(ast_field.name)
+    if duplicate_field is not None:
         ctxt.add_duplicate_field_error(ast_field, field_container, ast_field.name, duplicate_field)
         return True
 
@@ -256,9 +269,7 @@ def _bind_struct_common(ctxt, parsed_spec, struct, ast_struct):
     ast_struct.immutable = struct.immutable
     ast_struct.inline_chained_structs = struct.inline_chained_structs
     ast_struct.generate_comparison_operators = struct.generate_comparison_operators
-    ast_struct.cpp_name = struct.name
-    if struct.cpp_name:
-        ast_struct.cpp_name = struct.cpp_name
+    ast_struct.cpp_name = _intern(struct.cpp_name or struct.name)
 
     # Validate naming restrictions
     if ast_struct.name.startswith("array<"):
@@ -271,9 +282,9 @@ def _bind_struct_common(ctxt, parsed_spec, struct, ast_struct):
 
         for chained_type in struct.chained_types:
             ast_field = _bind_chained_type(ctxt, parsed_spec, ast_struct, chained_type)
-            if ast_field and not _is_duplicate_field(ctxt, chained_type.name, ast_struct.fields,
+            if ast_field and not _is_duplicate_field(ctxt, chained_type.name, ast_struct,
                                                      ast_field):
-                ast_struct.fields.append(ast_field)
+                ast_struct.add_field(ast_field)
 
     # Merge chained structs as a chained struct and ignored fields
     for chained_struct in struct.chained_structs or []:
@@ -292,8 +303,8 @@ def _bind_struct_common(ctxt, parsed_spec, struct, ast_struct):
                 ctxt.add_bad_field_non_const_getter_in_immutable_struct_error(
                     ast_struct, ast_struct.name, ast_field.name)
 
-            if not _is_duplicate_field(ctxt, ast_struct.name, ast_struct.fields, ast_field):
-                ast_struct.fields.append(ast_field)
+            if not _is_duplicate_field(ctxt, ast_struct.name, ast_struct, ast_field):
+                ast_struct.add_field(ast_field)
 
     # Fill out the field comparison_order property as needed
     if ast_struct.generate_comparison_operators and ast_struct.fields:
@@ -392,8 +403,8 @@ def _bind_command_type(ctxt, parsed_spec, command):
         cpp_name = struct.name
         if struct.cpp_name:
             cpp_name = struct.cpp_name
-        ast_field.struct_type = common.qualify_cpp_name(struct.cpp_namespace, cpp_name)
-        ast_field.bson_serialization_type = ["object"]
+        ast_field.struct_type = _intern(common.qualify_cpp_name(struct.cpp_namespace, cpp_name))
+        ast_field.bson_serialization_type = ("object", )
 
         _validate_field_of_type_struct(ctxt, ast_field)
     else:
@@ -401,9 +412,9 @@ def _bind_command_type(ctxt, parsed_spec, command):
         idltype = cast(syntax.Type, syntax_symbol)
 
         # Copy over the type fields first
-        ast_field.cpp_type = idltype.cpp_type
+        ast_field.cpp_type = _intern(idltype.cpp_type)
         ast_field.bson_serialization_type = idltype.bson_serialization_type
-        ast_field.bindata_subtype = idltype.bindata_subtype
+        ast_field.bindata_subtype = _intern(idltype.bindata_subtype)
         ast_field.serializer = _normalize_method_name(idltype.cpp_type, idltype.serializer)
         ast_field.deserializer = _normalize_method_name(idltype.cpp_type, idltype.deserializer)
         ast_field.default = idltype.default
@@ -461,7 +472,7 @@ def _bind_command(ctxt, parsed_spec, command):
     if command.reply_type:
         ast_command.reply_type = _bind_command_reply_type(ctxt, parsed_spec, command)
 
-    if [field for field in ast_command.fields if field.name == ast_command.name]:
+    if ast_command.find_field(ast_command.name) is not None:
         ctxt.add_bad_command_name_duplicates_field(ast_command, ast_command.name)
 
     return ast_command
@@ -501,7 +512,7 @@ def _validate_field_properties(ctxt, ast_field):
         ctxt.add_bad_field_default_and_optional(ast_field, ast_field.name)
 
     # A "chain" type should never appear as a field.
-    if ast_field.bson_serialization_type == ['chain']:
+    if ast_field.bson_serialization_type == ('chain', ):
         ctxt.add_bad_array_of_chain(ast_field, ast_field.name)
 
 
@@ -514,7 +525,7 @@ def _validate_doc_sequence_field(ctxt, ast_field):
     assert ast_field.array
 
     # The only allowed BSON type for a doc_sequence field is "object"
-    if ast_field.bson_serialization_type != ['object']:
+    if ast_field.bson_serialization_type != ('object', ):
         ctxt.add_bad_non_object_as_doc_sequence_error(ast_field, ast_field.name)
 
 
@@ -622,7 +633,7 @@ def _bind_condition(condition):
     if not condition:
         return None
 
-    ast_condition = ast.Condition(condition.file_name, condition.line, condition.column)
+    ast_condition = ast.Condition()
     ast_condition.expr = condition.expr
     ast_condition.constexpr = condition.constexpr
     ast_condition.preprocessor = condition.preprocessor
@@ -649,9 +660,7 @@ def _bind_field(ctxt, parsed_spec, field):
     ast_field.comparison_order = field.comparison_order
     ast_field.non_const_getter = field.non_const_getter
 
-    ast_field.cpp_name = field.name
-    if field.cpp_name:
-        ast_field.cpp_name = field.cpp_name
+    ast_field.cpp_name = _intern(field.cpp_name or field.name)
 
     # Validate naming restrictions
     if ast_field.name.startswith("array<"):
@@ -687,8 +696,8 @@ def _bind_field(ctxt, parsed_spec, field):
         cpp_name = struct.name
         if struct.cpp_name:
             cpp_name = struct.cpp_name
-        ast_field.struct_type = common.qualify_cpp_name(struct.cpp_namespace, cpp_name)
-        ast_field.bson_serialization_type = ["object"]
+        ast_field.struct_type = _intern(common.qualify_cpp_name(struct.cpp_namespace, cpp_name))
+        ast_field.bson_serialization_type = ("object", )
 
         _validate_field_of_type_struct(ctxt, field)
     elif isinstance(syntax_symbol, syntax.Enum):
@@ -696,7 +705,7 @@ def _bind_field(ctxt, parsed_spec, field):
 
         ast_field.enum_type = True
         ast_field.default = field.default
-        ast_field.cpp_type = enum_type_info.get_qualified_cpp_type_name()
+        ast_field.cpp_type = _intern(enum_type_info.get_qualified_cpp_type_name())
         ast_field.bson_serialization_type = enum_type_info.get_bson_types()
         ast_field.serializer = enum_type_info.get_enum_serializer_name()
         ast_field.deserializer = enum_type_info.get_enum_deserializer_name()
@@ -705,9 +714,9 @@ def _bind_field(ctxt, parsed_spec, field):
         idltype = cast(syntax.Type, syntax_symbol)
 
         # Copy over the type fields first
-        ast_field.cpp_type = idltype.cpp_type
+        ast_field.cpp_type = _intern(idltype.cpp_type)
         ast_field.bson_serialization_type = idltype.bson_serialization_type
-        ast_field.bindata_subtype = idltype.bindata_subtype
+        ast_field.bindata_subtype = _intern(idltype.bindata_subtype)
         ast_field.serializer = _normalize_method_name(idltype.cpp_type, idltype.serializer)
         ast_field.deserializer = _normalize_method_name(idltype.cpp_type, idltype.deserializer)
         ast_field.default = idltype.default
@@ -753,11 +762,11 @@ def _bind_chained_type(ctxt, parsed_spec, location, chained_type):
 
     ast_field = ast.Field(location.file_name, location.line, location.column)
     ast_field.name = idltype.name
-    ast_field.cpp_name = chained_type.cpp_name
+    ast_field.cpp_name = _intern(chained_type.cpp_name)
     ast_field.description = idltype.description
     ast_field.chained = True
 
-    ast_field.cpp_type = idltype.cpp_type
+    ast_field.cpp_type = _intern(idltype.cpp_type)
     ast_field.bson_serialization_type = idltype.bson_serialization_type
     ast_field.serializer = idltype.serializer
     ast_field.deserializer = idltype.deserializer
@@ -792,26 +801,25 @@ def _bind_chained_struct(ctxt, parsed_spec, ast_struct, chained_struct):
     # Configure a field for the chained struct.
     ast_chained_field = ast.Field(ast_struct.file_name, ast_struct.line, ast_struct.column)
     ast_chained_field.name = struct.name
-    ast_chained_field.cpp_name = chained_struct.cpp_name
+    ast_chained_field.cpp_name = _intern(chained_struct.cpp_name)
     ast_chained_field.description = struct.description
     cpp_name = struct.name
     if struct.cpp_name:
         cpp_name = struct.cpp_name
-    ast_chained_field.struct_type = cpp_name
-    ast_chained_field.bson_serialization_type = ["object"]
+    ast_chained_field.struct_type = _intern(cpp_name)
+    ast_chained_field.bson_serialization_type = ("object", )
 
     ast_chained_field.chained = True
 
-    if not _is_duplicate_field(ctxt, chained_struct.name, ast_struct.fields, ast_chained_field):
-        ast_struct.fields.append(ast_chained_field)
+    if not _is_duplicate_field(ctxt, chained_struct.name, ast_struct, ast_chained_field):
+        ast_struct.add_field(ast_chained_field)
     else:
         return
 
     # Merge all the fields from resolved struct into this ast struct.
     for field in struct.fields or []:
         ast_field = _bind_field(ctxt, parsed_spec, field)
-        if ast_field and not _is_duplicate_field(ctxt, chained_struct.name, ast_struct.fields,
-                                                 ast_field):
+        if ast_field and not _is_duplicate_field(ctxt, chained_struct.name, ast_struct, ast_field):
 
             if ast_struct.inline_chained_structs:
                 ast_field.chained_struct_field = ast_chained_field
@@ -819,7 +827,7 @@ def _bind_chained_struct(ctxt, parsed_spec, ast_struct, chained_struct):
                 # For non-inlined structs, mark them as ignore
                 ast_field.ignore = True
 
-            ast_struct.fields.append(ast_field)
+            ast_struct.add_field(ast_field)
 
 
 def _bind_globals(parsed_spec):
@@ -828,12 +836,12 @@ def _bind_globals(parsed_spec):
     if parsed_spec.globals:
         ast_global = ast.Global(parsed_spec.globals.file_name, parsed_spec.globals.line,
                                 parsed_spec.globals.column)
-        ast_global.cpp_namespace = parsed_spec.globals.cpp_namespace
-        ast_global.cpp_includes = parsed_spec.globals.cpp_includes
+        ast_global.cpp_namespace = _intern(parsed_spec.globals.cpp_namespace)
+        ast_global.cpp_includes = tuple(parsed_spec.globals.cpp_includes)
 
         configs = parsed_spec.globals.configs
         if configs:
-            ast_global.configs = ast.ConfigGlobal(configs.file_name, configs.line, configs.column)
+            ast_global.configs = ast.ConfigGlobal()
 
             if configs.initializer:
                 init = configs.initializer
@@ -892,7 +900,7 @@ def _bind_enum(ctxt, idl_enum):
     ast_enum.name = idl_enum.name
     ast_enum.description = idl_enum.description
     ast_enum.type = idl_enum.type
-    ast_enum.cpp_namespace = idl_enum.cpp_namespace
+    ast_enum.cpp_namespace = _intern(idl_enum.cpp_namespace)
 
     enum_type_info = enum_types.get_type_info(idl_enum)
     if not enum_type_info:
@@ -900,7 +908,7 @@ def _bind_enum(ctxt, idl_enum):
         return None
 
     for enum_value in idl_enum.values:
-        ast_enum_value = ast.EnumValue(enum_value.file_name, enum_value.line, enum_value.column)
+        ast_enum_value = ast.EnumValue()
         ast_enum_value.name = enum_value.name
         ast_enum_value.value = enum_value.value
         ast_enum.values.append(ast_enum_value)
@@ -961,7 +969,7 @@ def _bind_server_parameter_with_storage(ctxt, ast_param, param):
             ctxt.add_server_parameter_invalid_attr(param, field, 'bound')
             return None
 
-    ast_param.cpp_vartype = param.cpp_vartype
+    ast_param.cpp_vartype = _intern(param.cpp_vartype)
     ast_param.cpp_varname = param.cpp_varname
     ast_param.on_update = param.on_update
 
@@ -1013,7 +1021,7 @@ def _bind_server_parameter(ctxt, param):
     ast_param.condition = _bind_condition(param.condition)
     ast_param.redact = param.redact
     ast_param.test_only = param.test_only
-    ast_param.deprecated_name = param.deprecated_name
+    ast_param.deprecated_name = _intern_tuple(param.deprecated_name)
 
     ast_param.set_at = _bind_server_parameter_set_at(ctxt, param)
     if ast_param.set_at is None:
@@ -1118,8 +1126,8 @@ def _bind_config_option(ctxt, globals_spec, option):
 
     node.name = option.name
     node.short_name = option.short_name
-    node.deprecated_name = option.deprecated_name
-    node.deprecated_short_name = option.deprecated_short_name
+    node.deprecated_name = _intern_tuple(option.deprecated_name)
+    node.deprecated_short_name = tuple(option.deprecated_short_name)
 
     if (node.short_name is None) and not _is_invalid_config_short_name(node.name):
         # If the "dotted name" is usable as a "short name", mirror it by default.
@@ -1135,7 +1143,7 @@ def _bind_config_option(ctxt, globals_spec, option):
 
     node.description = _bind_expression(option.description)
     node.arg_vartype = option.arg_vartype
-    node.cpp_vartype = option.cpp_vartype
+    node.cpp_vartype = _intern(option.cpp_vartype)
     node.cpp_varname = option.cpp_varname
     node.condition = _bind_condition(option.condition)
 
@@ -1225,9 +1233,11 @@ def bind(parsed_spec):
 
     for feature_flag in parsed_spec.feature_flags:
         bound_spec.server_parameters.append(_bind_feature_flags(ctxt, feature_flag))
+        bound_spec.server_parameter_feature_flags.append(True)
 
     for server_parameter in parsed_spec.server_parameters:
         bound_spec.server_parameters.append(_bind_server_parameter(ctxt, server_parameter))
+        bound_spec.server_parameter_feature_flags.append(False)
 
     for option in parsed_spec.configs:
         bound_spec.configs.append(_bind_config_option(ctxt, parsed_spec.globals, option))
@@ -33,7 +33,19 @@ Classes which are shared among both the IDL idl.syntax and idl.AST trees.
 
 import os
 import string
-from typing import Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Mapping, Optional
+
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
+
+    def mypyc_attr(*_args, **_kwargs):  # type: ignore
+        """Stand in for mypy_extensions.mypyc_attr when mypy_extensions is not installed."""
+        return lambda cls: cls
+
 
 COMMAND_NAMESPACE_CONCATENATE_WITH_DB = "concatenate_with_db"
 COMMAND_NAMESPACE_CONCATENATE_WITH_DB_OR_UUID = "concatenate_with_db_or_uuid"
@@ -60,7 +72,7 @@ def camel_case(name):
 
 
 def qualify_cpp_name(cpp_namespace, cpp_type_name):
-    # type: (str, str) -> str
+    # type: (Optional[str], str) -> str
     """Preprend a type name with a C++ namespace if cpp_namespace is not None."""
     if cpp_namespace:
         return cpp_namespace + "::" + cpp_type_name
@@ -78,7 +90,7 @@ def _escape_template_string(template):
 
 
 def template_format(template, template_params=None):
-    # type: (str, Mapping[str,str]) -> str
+    # type: (str, Optional[Mapping[str,str]]) -> str
     """Write a template to the stream."""
     # Ignore the types since we use str literals and this expects str but works fine with
     # str.
@@ -99,9 +111,14 @@ def template_args(template, **kwargs):
     return string.Template(template).substitute(kwargs)  # type: ignore
 
 
+# The idl.syntax classes derive from SourceLocation and are never compiled, so keep a compiled
+# SourceLocation open to interpreted subclasses.
+@mypyc_attr(allow_interpreted_subclasses=True)
 class SourceLocation(object):
     """Source location information about an idl.syntax or idl.AST object."""
 
+    __slots__ = ("file_name", "line", "column")
+
     def __init__(self, file_name, line, column):
         # type: (str, int, int) -> None
         """Construct a source location."""
@@ -33,7 +33,7 @@ Support the code generation for enums
 
 from abc import ABCMeta, abstractmethod
 import textwrap
-from typing import cast, List, Optional, Union
+from typing import cast, List, Optional, Tuple, Union
 
 from . import ast
 from . import common
@@ -62,7 +62,7 @@ class EnumTypeInfoBase(object, metaclass=ABCMeta):
 
     @abstractmethod
     def get_bson_types(self):
-        # type: () -> List[str]
+        # type: () -> Tuple[str, ...]
         """Get the BSON type names for an enum."""
         pass
 
@@ -129,8 +129,8 @@ class _EnumTypeInt(EnumTypeInfoBase, metaclass=ABCMeta):
         return common.title_case(self._enum.name)
 
     def get_bson_types(self):
-        # type: () -> List[str]
-        return [self._enum.type]
+        # type: () -> Tuple[str, ...]
+        return (self._enum.type, )
 
     def get_cpp_value_assignment(self, enum_value):
         # type: (ast.EnumValue) -> str
@@ -203,8 +203,8 @@ class _EnumTypeString(EnumTypeInfoBase, metaclass=ABCMeta):
                                     enum_name=common.title_case(self._enum.name))
 
     def get_bson_types(self):
-        # type: () -> List[str]
-        return [self._enum.type]
+        # type: () -> Tuple[str, ...]
+        return (self._enum.type, )
 
     def get_cpp_value_assignment(self, enum_value):
         # type: (ast.EnumValue) -> str
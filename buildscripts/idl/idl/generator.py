@@ -37,7 +37,7 @@ import string
 import sys
 import textwrap
 import hashlib
-from typing import cast, Dict, List, Mapping, Tuple, Union
+from typing import cast, Dict, List, Mapping, Sequence, Tuple, Union
 
 from . import ast
 from . import bson
@@ -371,7 +371,7 @@ def _encaps(val):
 
 # Turn a list of pything strings into a C++ initializer list.
 def _encaps_list(vals):
-    # type: (List[str]) -> str
+    # type: (Sequence[str]) -> str
     if vals is None:
         return '{}'
 
@@ -934,7 +934,7 @@ class _CppHeaderFileWriter(_CppFileWriterBase):
             'mongo/bson/simple_bsonobj_comparator.h',
             'mongo/idl/idl_parser.h',
             'mongo/rpc/op_msg.h',
-        ] + spec.globals.cpp_includes
+        ] + list(spec.globals.cpp_includes)
 
         if spec.configs:
             header_list.append('mongo/util/options_parser/option_description.h')
@@ -944,7 +944,7 @@ class _CppHeaderFileWriter(_CppFileWriterBase):
                 header_list.append('mongo/util/options_parser/environment.h')
 
         if spec.server_parameters:
-            if [param for param in spec.server_parameters if param.feature_flag]:
+            if any(spec.server_parameter_feature_flags):
                 header_list.append('mongo/idl/feature_flag.h')
             header_list.append('mongo/idl/server_parameter.h')
             header_list.append('mongo/idl/server_parameter_with_storage.h')
@@ -1099,7 +1099,7 @@ class _CppSourceFileWriter(_CppFileWriterBase):
                                             method_name=method_name, expression=expression)
 
             # BSONObjects are allowed to be pass through without deserialization
-            assert field.bson_serialization_type == ['object']
+            assert field.bson_serialization_type == ('object', )
             return expression
 
         # Call a static class method with the signature:
@@ -1246,7 +1246,7 @@ class _CppSourceFileWriter(_CppFileWriterBase):
                 array_value = '%s::parse(tempContext, sequenceObject)' % (common.title_case(
                     field.struct_type))
             else:
-                assert field.bson_serialization_type == ['object']
+                assert field.bson_serialization_type == ('object', )
                 if field.deserializer:
                     array_value = '%s(sequenceObject)' % (field.deserializer)
                 else:
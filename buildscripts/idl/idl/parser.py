@@ -245,6 +245,10 @@ def _parse_type(ctxt, spec, name, node):
             "default": _RuleDesc('scalar'),
         })
 
+    # Every field of this type shares its bson_serialization_type, so freeze it here.
+    if idltype.bson_serialization_type is not None:
+        idltype.bson_serialization_type = tuple(idltype.bson_serialization_type)
+
     spec.symbols.add_type(ctxt, idltype)
 
 
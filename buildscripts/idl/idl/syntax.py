@@ -269,7 +269,7 @@ class Type(common.SourceLocation):
         self.name = None  # type: str
         self.description = None  # type: str
         self.cpp_type = None  # type: str
-        self.bson_serialization_type = None  # type: List[str]
+        self.bson_serialization_type = None  # type: Tuple[str, ...]
         self.bindata_subtype = None  # type: str
         self.serializer = None  # type: str
         self.deserializer = None  # type: str
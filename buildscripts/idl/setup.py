@@ -0,0 +1,130 @@
+# Copyright (C) 2021-present MongoDB, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Server Side Public License, version 1,
+# as published by MongoDB, Inc.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# Server Side Public License for more details.
+#
+# You should have received a copy of the Server Side Public License
+# along with this program. If not, see
+# <http://www.mongodb.com/licensing/server-side-public-license>.
+#
+# As a special exception, the copyright holders give permission to link the
+# code of portions of this program with the OpenSSL library under certain
+# conditions as described in each individual source file and distribute
+# linked combinations including the program with the OpenSSL library. You
+# must comply with the Server Side Public License in all respects for
+# all of the code used other than as permitted herein. If you modify file(s)
+# with this exception, you may extend this exception to your version of the
+# file(s), but you are not obligated to do so. If you do not wish to do so,
+# delete this exception statement from your version. If you delete this
+# exception statement from all source files in the program, then also delete
+# it in the license file.
+#
+"""
+Optional native build of the IDL compiler's AST modules.
+
+The IDL compiler is pure Python and runs as-is. When mypyc or Cython is installed, the AST modules
+can be compiled in place to native extensions, which the import system picks up ahead of the .py
+files. From this directory, run one of:
+
+    IDL_MYPYC=1 python3 setup.py build_ext --inplace
+    IDL_CYTHON=1 python3 setup.py build_ext --inplace
+
+If both are set, mypyc is used. Without either set, or if the requested compiler is not installed,
+no extensions are built and the pure Python modules are used.
+"""
+
+import os
+import sys
+
+from setuptools import Extension, setup
+
+# Modules compiled to native extensions, relative to this file.
+NATIVE_MODULES = [
+    "idl/ast.py",
+    "idl/common.py",
+]
+
+# Options for the mypy pass run by mypyc. Ignore the repository's .mypy.ini, whose
+# strict_optional = False mypyc refuses to compile under. The compiled modules only import the rest
+# of the package for type checking, so do not fail the build on errors elsewhere in it.
+MYPYC_OPTIONS = [
+    "--config-file=",
+    "--strict-optional",
+    "--explicit-package-bases",
+    "--follow-imports=silent",
+    "--ignore-missing-imports",
+]
+
+
+def _is_requested(env_var):
+    # type: (str) -> bool
+    """Return True if the environment variable requests a native build."""
+    return os.environ.get(env_var, "0").lower() not in ("", "0", "false", "no")
+
+
+def _use_mypyc():
+    # type: () -> bool
+    """Return True if the mypyc build is requested and available."""
+    if not _is_requested("IDL_MYPYC"):
+        return False
+
+    try:
+        import mypyc  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        print("IDL_MYPYC is set but mypyc is not installed, using pure Python modules",
+              file=sys.stderr)
+        return False
+
+    return True
+
+
+def _use_cython():
+    # type: () -> bool
+    """Return True if the Cython build is requested and available."""
+    if not _is_requested("IDL_CYTHON"):
+        return False
+
+    try:
+        import Cython  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        print("IDL_CYTHON is set but Cython is not installed, using pure Python modules",
+              file=sys.stderr)
+        return False
+
+    return True
+
+
+def _get_ext_modules():
+    # type: () -> list
+    """Get the list of native extensions to build."""
+    if _use_mypyc():
+        from mypyc.build import mypycify  # pylint: disable=import-outside-toplevel
+
+        return mypycify(MYPYC_OPTIONS + NATIVE_MODULES)
+
+    if _use_cython():
+        from Cython.Build import cythonize  # pylint: disable=import-outside-toplevel
+
+        # This directory is itself a package, so name the extensions explicitly. Given bare paths,
+        # cythonize would name them idl.idl.ast and idl.idl.common.
+        extensions = [
+            Extension(os.path.splitext(path)[0].replace("/", "."), [path])
+            for path in NATIVE_MODULES
+        ]
+        return cythonize(extensions, compiler_directives={"language_level": 3})
+
+    return []
+
+
+setup(
+    name="idl",
+    description="MongoDB IDL Compiler",
+    packages=["idl"],
+    ext_modules=_get_ext_modules(),
+)
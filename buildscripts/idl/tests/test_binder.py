@@ -87,7 +87,7 @@ class TestBinder(testcase.IDLTestcase):
                 - 'bar'
                 - 'foo'"""))
         self.assertEqual(spec.globals.cpp_namespace, "something")
-        self.assertListEqual(spec.globals.cpp_includes, ['bar', 'foo'])
+        self.assertTupleEqual(spec.globals.cpp_includes, ('bar', 'foo'))
 
     def test_type_positive(self):
         # type: () -> None
@@ -538,7 +538,7 @@ class TestBinder(testcase.IDLTestcase):
                 default: foo
         """)
 
-        self.assert_bind(test_preamble + textwrap.dedent("""
+        spec = self.assert_bind(test_preamble + textwrap.dedent("""
             structs:
                 foo:
                     description: foo
@@ -546,6 +546,9 @@ class TestBinder(testcase.IDLTestcase):
                     fields:
                         foo: string
             """))
+        struct = spec.structs[0]
+        self.assertIs(struct.find_field("foo"), struct.fields[0])
+        self.assertIsNone(struct.find_field("bar"))
 
     def test_struct_negative(self):
         # type: () -> None
@@ -1248,7 +1251,7 @@ class TestBinder(testcase.IDLTestcase):
         """Positive enum test cases."""
 
         # Test int
-        self.assert_bind(
+        spec = self.assert_bind(
             textwrap.dedent("""
         enums:
             foo:
@@ -2017,7 +2020,7 @@ class TestBinder(testcase.IDLTestcase):
         """Test feature flag checks around version."""
 
         # feature flag can default to false without a version
-        self.assert_bind(
+        spec = self.assert_bind(
             textwrap.dedent("""
             feature_flags:
                 featureFlagToaster:
@@ -2025,6 +2028,29 @@ class TestBinder(testcase.IDLTestcase):
                     cpp_varname: gToaster
                     default: false
             """))
+        self.assertListEqual(spec.server_parameter_feature_flags,
+                             [param.feature_flag for param in spec.server_parameters])
+        self.assertListEqual(spec.server_parameter_feature_flags, [True])
+
+        # feature flags and plain server parameters in the same file
+        spec = self.assert_bind(
+            textwrap.dedent("""
+            feature_flags:
+                featureFlagToaster:
+                    description: "Make toast"
+                    cpp_varname: gToaster
+                    default: false
+            server_parameters:
+                foo:
+                    set_at: startup
+                    description: bar
+                    cpp_varname: baz
+            """))
+        self.assertListEqual([param.name for param in spec.server_parameters],
+                             ['featureFlagToaster', 'foo'])
+        self.assertListEqual(spec.server_parameter_feature_flags,
+                             [param.feature_flag for param in spec.server_parameters])
+        self.assertListEqual(spec.server_parameter_feature_flags, [True, False])
 
         # feature flag can default to true with a version
         self.assert_bind(
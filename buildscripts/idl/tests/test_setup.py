@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2021-present MongoDB, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Server Side Public License, version 1,
+# as published by MongoDB, Inc.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# Server Side Public License for more details.
+#
+# You should have received a copy of the Server Side Public License
+# along with this program. If not, see
+# <http://www.mongodb.com/licensing/server-side-public-license>.
+#
+# As a special exception, the copyright holders give permission to link the
+# code of portions of this program with the OpenSSL library under certain
+# conditions as described in each individual source file and distribute
+# linked combinations including the program with the OpenSSL library. You
+# must comply with the Server Side Public License in all respects for
+# all of the code used other than as permitted herein. If you modify file(s)
+# with this exception, you may extend this exception to your version of the
+# file(s), but you are not obligated to do so. If you do not wish to do so,
+# delete this exception statement from your version. If you delete this
+# exception statement from all source files in the program, then also delete
+# it in the license file.
+#
+"""Test cases for the optional native builds in setup.py."""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import List
+
+IDL_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+MYPY_INI = os.path.join(IDL_DIR, '..', '..', '.mypy.ini')
+
+
+class TestSetup(unittest.TestCase):
+    """Build the native extensions in a scratch copy of the IDL compiler."""
+
+    def _build_and_import(self, env_var, modules):
+        # type: (str, List[str]) -> None
+        """Build with env_var set, and check that each module imports from an extension."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            build_dir = os.path.join(temp_dir, 'idl')
+            shutil.copytree(
+                IDL_DIR, build_dir, ignore=shutil.ignore_patterns('build', '__pycache__', '*.so',
+                                                                  '*.c', 'test_setup.py'))
+            # mypy looks for a config file in the parent directories, so give the copy the same
+            # one the in-tree build finds.
+            if os.path.exists(MYPY_INI):
+                shutil.copy(MYPY_INI, temp_dir)
+
+            env = dict(os.environ)
+            env[env_var] = '1'
+            build = subprocess.run([sys.executable, 'setup.py', 'build_ext', '--inplace'],
+                                   cwd=build_dir, env=env, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, universal_newlines=True)
+            self.assertEqual(build.returncode, 0, build.stdout)
+
+            for module in modules:
+                loaded = subprocess.run(
+                    [sys.executable, '-c',
+                     'import %s; print(%s.__file__)' % (module, module)], cwd=build_dir,
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+                self.assertEqual(loaded.returncode, 0, loaded.stdout)
+                self.assertFalse(loaded.stdout.strip().endswith('.py'), loaded.stdout)
+
+            tests = subprocess.run(
+                [sys.executable, '-m', 'unittest', 'discover', '-s', 'tests', '-t', '.'],
+                cwd=build_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                universal_newlines=True)
+            self.assertEqual(tests.returncode, 0, tests.stdout)
+
+    @unittest.skipUnless(importlib.util.find_spec('Cython'), 'Cython is not installed')
+    def test_cython_build(self):
+        # type: () -> None
+        """Cython build of the native modules."""
+        self._build_and_import('IDL_CYTHON', ['idl.ast', 'idl.common'])
+
+    @unittest.skipUnless(importlib.util.find_spec('mypyc'), 'mypyc is not installed')
+    def test_mypyc_build(self):
+        # type: () -> None
+        """mypyc build of the native modules."""
+        self._build_and_import('IDL_MYPYC', ['idl.ast', 'idl.common'])
+
+
+if __name__ == '__main__':
+
+    unittest.main()